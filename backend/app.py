@@ -1,35 +1,183 @@
 """FastAPI server for Spot Web Controller."""
 import asyncio
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import anyio.to_thread
+import orjson
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, ConfigDict
 
 from backend.config import config
 from backend.logging_setup import setup_logging, log_buffer
-from backend.spot_bridge import SpotBridge
+from backend.spot_bridge import SpotBridge, get_bridge
+
+LOG_FILE = "spot_web.log"
 
 # Setup logging
-setup_logging(log_level=config.LOG_LEVEL, log_file="spot_web.log")
+setup_logging(log_level=config.LOG_LEVEL, log_file=LOG_FILE)
 logger = logging.getLogger(__name__)
 
+# Redacted config view (built once by Config)
+CONFIG_PUBLIC = config.to_dict(include_secrets=False)
+
 # Global Spot bridge instance
 spot_bridge: Optional[SpotBridge] = None
 
 
+def make_error(e: Exception) -> dict:
+    """Build the standard error payload for an unexpected endpoint exception."""
+    return {
+        "ok": False,
+        "error": {
+            "error_type": e.__class__.__name__,
+            "message": str(e),
+            "suggested_fix": "Check logs for details"
+        }
+    }
+
+
+# Seconds a telemetry send may take before the subscriber is dropped
+BROADCAST_SEND_TIMEOUT = 0.5
+
+
+class ConnectionManager:
+    """Tracks telemetry WebSockets and fans each payload out to all of them."""
+
+    def __init__(self):
+        self.connections: set[WebSocket] = set()
+        self.lock = asyncio.Lock()
+        # Close tasks for dropped sockets, referenced until they finish
+        self.closing: set[asyncio.Task] = set()
+
+    async def connect(self, websocket: WebSocket):
+        """Subscribe an accepted WebSocket to broadcasts."""
+        async with self.lock:
+            self.connections.add(websocket)
+
+    async def disconnect(self, websocket: WebSocket):
+        """Unsubscribe a WebSocket."""
+        async with self.lock:
+            self.connections.discard(websocket)
+
+    async def broadcast(self, payload: bytes):
+        """Send a pre-serialized payload to every subscriber concurrently."""
+        async with self.lock:
+            sockets = list(self.connections)
+        if not sockets:
+            return
+
+        # A client that stops reading fills its TCP window; bound each send so it
+        # cannot hold up the other subscribers
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_bytes(payload), BROADCAST_SEND_TIMEOUT) for ws in sockets),
+            return_exceptions=True
+        )
+
+        # Drop sockets whose send failed or timed out, and close them so the client's
+        # onclose reconnect kicks in (a timed-out send may also have left a partial frame)
+        dead = [ws for ws, result in zip(sockets, results) if isinstance(result, Exception)]
+        if dead:
+            async with self.lock:
+                self.connections.difference_update(dead)
+            for ws in dead:
+                task = asyncio.create_task(self._close(ws))
+                self.closing.add(task)
+                task.add_done_callback(self.closing.discard)
+
+    async def _close(self, websocket: WebSocket):
+        """Close a dropped subscriber, giving up after BROADCAST_SEND_TIMEOUT."""
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), BROADCAST_SEND_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Error closing dropped telemetry WebSocket: {e}")
+
+
+telemetry_manager = ConnectionManager()
+
+# Latest robot status shared by all telemetry sockets: (monotonic_time, status)
+latest_status: Optional[tuple[float, dict]] = None
+
+
+async def _status_producer():
+    """Poll robot status at 1Hz and broadcast it to all telemetry sockets."""
+    global latest_status
+
+    while True:
+        try:
+            status = await run_in_threadpool(spot_bridge.get_status)
+        except Exception as e:
+            logger.error(f"Error polling status: {e}", exc_info=True)
+            status = make_error(e)
+
+        latest_status = (time.monotonic(), status)
+
+        # Serialize once per tick, not once per client
+        await telemetry_manager.broadcast(orjson.dumps(status))
+        await asyncio.sleep(1.0)  # 1Hz update rate (reduced to avoid rate limiting)
+
+
+# Latest pending velocity command; a newer command replaces an unsent one
+velocity_queue: Optional[asyncio.Queue] = None
+# Result of the most recently forwarded velocity command
+last_velocity_result: Optional[dict] = None
+
+
+def _drop_pending_velocity():
+    """Discard an unsent velocity command."""
+    if velocity_queue:
+        try:
+            velocity_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+
+def _clear_pending_velocity():
+    """Discard an unsent velocity command and the last forwarded result (on connect/disconnect)."""
+    global last_velocity_result
+
+    last_velocity_result = None
+    _drop_pending_velocity()
+
+
+async def _velocity_sender():
+    """Forward queued velocity commands to the robot, one RPC in flight at a time."""
+    global last_velocity_result
+
+    while True:
+        cmd = await velocity_queue.get()
+        try:
+            last_velocity_result = await spot_bridge.send_velocity_async(
+                cmd.vx, cmd.vy, cmd.yaw,
+                cmd.body_height, cmd.body_roll, cmd.body_pitch, cmd.body_yaw,
+                cmd.locomotion_hint
+            )
+        except Exception as e:
+            logger.error(f"Error forwarding velocity command: {e}", exc_info=True)
+            last_velocity_result = make_error(e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global spot_bridge
+    global spot_bridge, velocity_queue
 
     # Startup
     logger.info("Starting Spot Web Controller")
-    logger.info(f"Config: {config.to_dict(include_secrets=False)}")
+    logger.info(f"Config: {CONFIG_PUBLIC}")
 
     # Validate configuration
     is_valid, error_msg = config.validate()
@@ -37,20 +185,39 @@ async def lifespan(app: FastAPI):
         logger.error(f"Configuration error: {error_msg}")
         logger.warning("Server starting but connection will fail without valid config")
 
-    # Create bridge instance
-    spot_bridge = SpotBridge(
+    # Blocking SDK calls run in the threadpool; allow more of them in flight
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
+    # Short-lived response cache for polled endpoints
+    FastAPICache.init(InMemoryBackend())
+
+    # Get the shared bridge instance
+    spot_bridge = get_bridge(
         hostname=config.SPOT_HOST,
         username=config.SPOT_USER,
         password=config.SPOT_PASS
     )
 
+    # Single status poller shared by every telemetry connection
+    status_task = asyncio.create_task(_status_producer())
+
+    # Single sender draining coalesced velocity commands
+    velocity_queue = asyncio.Queue(maxsize=1)
+    velocity_task = asyncio.create_task(_velocity_sender())
+
     yield
 
     # Shutdown
     logger.info("Shutting down Spot Web Controller")
+    for task in (status_task, velocity_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     if spot_bridge and spot_bridge.connected:
         logger.info("Disconnecting from Spot...")
-        spot_bridge.disconnect()
+        await run_in_threadpool(spot_bridge.disconnect)
 
 
 # Create FastAPI app
@@ -58,21 +225,42 @@ app = FastAPI(
     title="Spot Web Controller",
     description="Local web controller for Boston Dynamics Spot",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# CORS middleware for local development
+# CORS middleware for local development: an explicit origin list instead of
+# echoing any origin, and preflight results cached by the browser for a day
+cors_origins = [
+    f"http://localhost:{config.BIND_PORT}",
+    f"http://127.0.0.1:{config.BIND_PORT}",
+]
+if config.BIND_HOST not in ("0.0.0.0", "localhost", "127.0.0.1"):
+    cors_origins.append(f"http://{config.BIND_HOST}:{config.BIND_PORT}")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# Compress JSON and static assets (JS/CSS/HTML, model files)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Report invalid request bodies; orjson renders rejected NaN/Infinity inputs as null."""
+    return ORJSONResponse(status_code=422, content={"detail": jsonable_encoder(exc.errors())})
+
 
 # Request/Response models
 class VelocityCommand(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True, allow_inf_nan=False)
+
     vx: float
     vy: float
     yaw: float
@@ -85,13 +273,14 @@ class VelocityCommand(BaseModel):
 
 # Health and info endpoints
 @app.get("/api/health")
+@cache(expire=1, namespace="status")
 async def health():
     """Server health check."""
     return {
         "ok": True,
         "data": {
             "server": "running",
-            "config": config.to_dict(include_secrets=False),
+            "config": CONFIG_PUBLIC,
             "connected": spot_bridge.connected if spot_bridge else False,
         }
     }
@@ -102,24 +291,19 @@ async def health():
 async def connect():
     """Connect to Spot robot."""
     if not spot_bridge:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"ok": False, "error": {"message": "Bridge not initialized"}}
         )
 
     try:
-        result = spot_bridge.connect()
+        _clear_pending_velocity()
+        result = await run_in_threadpool(spot_bridge.connect)
+        await FastAPICache.clear(namespace="status")
         return result
     except Exception as e:
         logger.error(f"Error in connect endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/disconnect")
@@ -129,39 +313,28 @@ async def disconnect():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.disconnect()
+        _clear_pending_velocity()
+        result = await run_in_threadpool(spot_bridge.disconnect)
+        await FastAPICache.clear(namespace="status")
         return result
     except Exception as e:
         logger.error(f"Error in disconnect endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.get("/api/status")
+@cache(expire=1, namespace="status")
 async def get_status():
     """Get current robot status."""
     if not spot_bridge:
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.get_status()
+        result = await run_in_threadpool(spot_bridge.get_status)
         return result
     except Exception as e:
         logger.error(f"Error in status endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 # Power control endpoints
@@ -172,18 +345,11 @@ async def power_on():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.power_on()
+        result = await run_in_threadpool(spot_bridge.power_on)
         return result
     except Exception as e:
         logger.error(f"Error in power_on endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/power/off")
@@ -193,18 +359,11 @@ async def power_off():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.power_off()
+        result = await run_in_threadpool(spot_bridge.power_off)
         return result
     except Exception as e:
         logger.error(f"Error in power_off endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 # Command endpoints
@@ -215,18 +374,11 @@ async def command_stand():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.stand()
+        result = await run_in_threadpool(spot_bridge.stand)
         return result
     except Exception as e:
         logger.error(f"Error in stand endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/command/sit")
@@ -236,18 +388,11 @@ async def command_sit():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.sit()
+        result = await run_in_threadpool(spot_bridge.sit)
         return result
     except Exception as e:
         logger.error(f"Error in sit endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/command/stop")
@@ -257,46 +402,42 @@ async def command_stop():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.stop()
+        # Don't let a queued velocity command run after the stop
+        _drop_pending_velocity()
+        result = await run_in_threadpool(spot_bridge.stop)
         return result
     except Exception as e:
         logger.error(f"Error in stop endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/command/velocity")
 async def command_velocity(cmd: VelocityCommand):
-    """Send velocity command with optional gait and body pose customization."""
+    """Queue a velocity command with optional gait and body pose customization.
+
+    Commands are coalesced: if the previous one hasn't been sent yet it is
+    replaced, so the robot always receives the newest command.
+    """
     if not spot_bridge:
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
+    if not spot_bridge.connected:
+        return {"ok": False, "error": {"message": "Not connected"}}
 
     try:
-        result = spot_bridge.send_velocity(
-            cmd.vx, cmd.vy, cmd.yaw,
-            cmd.body_height, cmd.body_roll, cmd.body_pitch, cmd.body_yaw,
-            cmd.locomotion_hint
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error in velocity endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        velocity_queue.put_nowait(cmd)
+    except asyncio.QueueFull:
+        _drop_pending_velocity()
+        velocity_queue.put_nowait(cmd)
+
+    # Surface failures from the previously forwarded command
+    if last_velocity_result and not last_velocity_result["ok"]:
+        return last_velocity_result
+    return {"ok": True, "data": {"queued": True}}
 
 
 class BodyPoseCommand(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True, allow_inf_nan=False)
+
     height: float
     roll: float = 0.0
     pitch: float = 0.0
@@ -310,18 +451,13 @@ async def command_body_pose(cmd: BodyPoseCommand):
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.set_body_pose(cmd.height, cmd.roll, cmd.pitch, cmd.yaw)
+        result = await run_in_threadpool(
+            spot_bridge.set_body_pose, cmd.height, cmd.roll, cmd.pitch, cmd.yaw
+        )
         return result
     except Exception as e:
         logger.error(f"Error in body_pose endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 # E-Stop endpoints
@@ -332,18 +468,11 @@ async def estop_stop():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.estop_stop()
+        result = await run_in_threadpool(spot_bridge.estop_stop)
         return result
     except Exception as e:
         logger.error(f"Error in estop_stop endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.post("/api/estop/release")
@@ -353,18 +482,11 @@ async def estop_release():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.estop_release()
+        result = await run_in_threadpool(spot_bridge.estop_release)
         return result
     except Exception as e:
         logger.error(f"Error in estop_release endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 # Diagnostics endpoints
@@ -375,18 +497,11 @@ async def diagnose():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.diagnose()
+        result = await run_in_threadpool(spot_bridge.diagnose)
         return result
     except Exception as e:
         logger.error(f"Error in diagnose endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.get("/api/test-connection")
@@ -396,44 +511,21 @@ async def test_connection():
         return {"ok": False, "error": {"message": "Bridge not initialized"}}
 
     try:
-        result = spot_bridge.test_connection()
+        result = await run_in_threadpool(spot_bridge.test_connection)
         return result
     except Exception as e:
         logger.error(f"Error in test_connection endpoint: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+        return make_error(e)
 
 
 @app.get("/api/logs/download")
 async def download_logs():
     """Download log file."""
-    try:
-        with open("spot_web.log", "r") as f:
-            content = f.read()
-        return JSONResponse(
-            content={"ok": True, "data": {"logs": content}},
-            headers={
-                "Content-Disposition": "attachment; filename=spot_web.log"
-            }
-        )
-    except FileNotFoundError:
+    if not os.path.isfile(LOG_FILE):
         return {"ok": False, "error": {"message": "Log file not found"}}
-    except Exception as e:
-        logger.error(f"Error downloading logs: {e}", exc_info=True)
-        return {
-            "ok": False,
-            "error": {
-                "error_type": e.__class__.__name__,
-                "message": str(e),
-                "suggested_fix": "Check logs for details"
-            }
-        }
+
+    # Streamed from disk (sendfile where available) rather than read into memory
+    return FileResponse(path=LOG_FILE, filename=LOG_FILE, media_type="text/plain")
 
 
 # WebSocket endpoints
@@ -444,20 +536,20 @@ async def telemetry_websocket(websocket: WebSocket):
     logger.info("Telemetry WebSocket connected")
 
     try:
+        # Send the last known status right away, then leave updates to the producer
+        if latest_status:
+            await websocket.send_bytes(orjson.dumps(latest_status[1]))
+        await telemetry_manager.connect(websocket)
+
+        # Clients don't send anything; receiving only detects the disconnect
         while True:
-            if spot_bridge:
-                status = spot_bridge.get_status()
-                await websocket.send_json(status)
-            else:
-                await websocket.send_json({
-                    "ok": False,
-                    "error": {"message": "Bridge not initialized"}
-                })
-            await asyncio.sleep(1.0)  # 1Hz update rate (reduced to avoid rate limiting)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         logger.info("Telemetry WebSocket disconnected")
     except Exception as e:
         logger.error(f"Error in telemetry WebSocket: {e}", exc_info=True)
+    finally:
+        await telemetry_manager.disconnect(websocket)
 
 
 @app.websocket("/ws/logs")
@@ -467,37 +559,81 @@ async def logs_websocket(websocket: WebSocket):
     logger.info("Logs WebSocket connected")
 
     # Create queue for this connection
-    log_queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    log_queue = asyncio.Queue(maxsize=10_000)
 
-    def log_callback(record):
-        """Callback for new log entries."""
+    def enqueue(record):
+        """Queue a log entry on the event loop, dropping the oldest when full."""
         try:
-            asyncio.create_task(log_queue.put(record))
-        except Exception:
-            pass
+            log_queue.put_nowait(record)
+        except asyncio.QueueFull:
+            log_queue.get_nowait()
+            log_queue.put_nowait(record)
+
+    def log_callback(record):
+        """Callback for new log entries (may run on any thread)."""
+        # Raises once the loop is closed, letting the buffer drop this listener
+        loop.call_soon_threadsafe(enqueue, record)
 
     # Add listener
-    log_buffer.add_listener(log_callback)
+    if not log_buffer.add_listener(log_callback):
+        logger.warning("Too many log listeners, rejecting logs WebSocket")
+        await websocket.close(code=1013)
+        return
+
+    async def watch_disconnect():
+        """Wait for the client to go away, then wake the sender with a sentinel."""
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            enqueue(None)
+
+    watcher = asyncio.create_task(watch_disconnect())
 
     try:
-        # Send existing logs
-        for record in log_buffer.get_all():
+        # Send existing logs, yielding periodically so a full replay doesn't block the loop
+        for i, record in enumerate(log_buffer.get_all()):
             await websocket.send_json(record)
+            if i % 50 == 0:
+                await asyncio.sleep(0)
 
-        # Stream new logs
+        # Stream new logs, draining bursts into a single batched frame
         while True:
-            record = await log_queue.get()
-            await websocket.send_json(record)
+            batch = [await log_queue.get()]
+            while not log_queue.empty() and len(batch) < 64:
+                batch.append(log_queue.get_nowait())
+            if None in batch:
+                logger.info("Logs WebSocket disconnected")
+                break
+            await websocket.send_json(batch)
     except WebSocketDisconnect:
         logger.info("Logs WebSocket disconnected")
     except Exception as e:
         logger.error(f"Error in logs WebSocket: {e}", exc_info=True)
     finally:
         log_buffer.remove_listener(log_callback)
+        watcher.cancel()
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that sets Cache-Control on every file response."""
+
+    # Vendored third-party bundles that only change when replaced wholesale
+    immutable_prefixes = ("mediapipe/", "tf-handpose.js")
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if scope["path"].lstrip("/").startswith(self.immutable_prefixes):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            # App files change between releases; revalidate via ETag/Last-Modified
+            response.headers["Cache-Control"] = "no-cache"
+        return response
 
 
 # Mount static files (must be last)
-app.mount("/", StaticFiles(directory="frontend", html=True), name="static")
+app.mount("/", CachedStaticFiles(directory="frontend", html=True), name="static")
 
 
 if __name__ == "__main__":
@@ -506,5 +642,8 @@ if __name__ == "__main__":
         "backend.app:app",
         host=config.BIND_HOST,
         port=config.BIND_PORT,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=config.WEB_CONCURRENCY,
+        reload=False
     )
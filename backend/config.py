@@ -11,6 +11,9 @@ class Config:
     """Application configuration loaded from environment variables."""
 
     def __init__(self):
+        # Integer variables that failed to parse, reported by validate()
+        self._parse_errors: list[str] = []
+
         # Required variables
         self.SPOT_HOST: str = os.getenv("SPOT_HOST", "")
         self.SPOT_USER: str = os.getenv("SPOT_USER", "")
@@ -18,8 +21,27 @@ class Config:
 
         # Optional variables with defaults
         self.BIND_HOST: str = os.getenv("BIND_HOST", "0.0.0.0")
-        self.BIND_PORT: int = int(os.getenv("BIND_PORT", "8080"))
+        self.BIND_PORT: int = self._getenv_int("BIND_PORT", 8080)
         self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+        # Each worker process holds its own SpotBridge and robot lease, so
+        # more than one worker only makes sense without a robot connection
+        self.WEB_CONCURRENCY: int = self._getenv_int("WEB_CONCURRENCY", 1)
+
+        # Config is fixed after startup, so compute derived values once
+        self._validation = self._validate()
+        self._public = self._build_dict(include_secrets=False)
+        self._full = self._build_dict(include_secrets=True)
+
+    def _getenv_int(self, name: str, default: int) -> int:
+        """Read an integer variable, falling back to the default if it doesn't parse."""
+        value = os.getenv(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            self._parse_errors.append(f"{name} must be an integer, got {value!r}")
+            return default
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """
@@ -28,6 +50,13 @@ class Config:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return self._validation
+
+    def _validate(self) -> tuple[bool, Optional[str]]:
+        """Run the validation checks."""
+        if self._parse_errors:
+            return False, self._parse_errors[0]
+
         if not self.SPOT_HOST:
             return False, "SPOT_HOST environment variable is required"
         if not self.SPOT_USER:
@@ -40,18 +69,27 @@ class Config:
         if self.LOG_LEVEL not in valid_levels:
             return False, f"LOG_LEVEL must be one of {valid_levels}"
 
+        if self.WEB_CONCURRENCY < 1:
+            return False, "WEB_CONCURRENCY must be at least 1"
+
         return True, None
 
     def to_dict(self, include_secrets: bool = False) -> dict:
         """
         Convert config to dictionary.
 
+        The returned dict is shared between callers and must not be modified.
+
         Args:
             include_secrets: Whether to include sensitive values
 
         Returns:
             Dictionary representation of config
         """
+        return self._full if include_secrets else self._public
+
+    def _build_dict(self, include_secrets: bool) -> dict:
+        """Build the dictionary representation of config."""
         return {
             "SPOT_HOST": self.SPOT_HOST,
             "SPOT_USER": self.SPOT_USER if include_secrets else "***",
@@ -59,6 +97,7 @@ class Config:
             "BIND_HOST": self.BIND_HOST,
             "BIND_PORT": self.BIND_PORT,
             "LOG_LEVEL": self.LOG_LEVEL,
+            "WEB_CONCURRENCY": self.WEB_CONCURRENCY,
         }
 
 
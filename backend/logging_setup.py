@@ -1,51 +1,99 @@
 """Logging setup with in-memory buffer for streaming."""
+import atexit
 import logging
+import queue
 import sys
+import time
 from collections import deque
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from threading import Lock
 from typing import Optional
 
 
+# Listeners failing this many times in a row are removed
+MAX_LISTENER_FAILURES = 5
+
+
 class InMemoryLogBuffer:
     """Thread-safe in-memory buffer for log entries."""
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, max_listeners: int = 32):
         self.buffer = deque(maxlen=max_size)
         self.lock = Lock()
-        self.listeners = []
+        self.max_listeners = max_listeners
+        # Copy-on-write mapping of listener -> consecutive failure count, so
+        # append() can notify without holding the lock
+        self.listeners: dict = {}
 
     def append(self, record: dict):
         """Add a log record to the buffer."""
         with self.lock:
             self.buffer.append(record)
-            # Notify all listeners
-            for listener in self.listeners:
-                try:
-                    listener(record)
-                except Exception:
-                    pass
+            listeners = self.listeners
+
+        # Notify all listeners outside the lock so a slow one can't block other loggers
+        failed = []
+        recovered = []
+        for listener, failures in listeners.items():
+            try:
+                listener(record)
+            except Exception:
+                failed.append(listener)
+                continue
+            if failures:
+                recovered.append(listener)
+
+        if failed or recovered:
+            self._update_failures(failed, recovered)
+
+    def _update_failures(self, failed: list, recovered: list):
+        """Track consecutive listener failures and drop listeners that keep failing."""
+        with self.lock:
+            listeners = dict(self.listeners)
+            for listener in recovered:
+                if listener in listeners:
+                    listeners[listener] = 0
+            for listener in failed:
+                if listener not in listeners:
+                    continue
+                listeners[listener] += 1
+                if listeners[listener] > MAX_LISTENER_FAILURES:
+                    del listeners[listener]
+            self.listeners = listeners
 
     def get_all(self) -> list[dict]:
         """Get all log records from the buffer."""
         with self.lock:
             return list(self.buffer)
 
-    def add_listener(self, callback):
-        """Add a listener that will be called for each new log entry."""
+    def add_listener(self, callback) -> bool:
+        """
+        Add a listener that will be called for each new log entry.
+
+        Returns:
+            False if the listener limit has been reached
+        """
         with self.lock:
-            self.listeners.append(callback)
+            if len(self.listeners) >= self.max_listeners:
+                return False
+            self.listeners = {**self.listeners, callback: 0}
+            return True
 
     def remove_listener(self, callback):
         """Remove a listener."""
         with self.lock:
             if callback in self.listeners:
-                self.listeners.remove(callback)
+                listeners = dict(self.listeners)
+                del listeners[callback]
+                self.listeners = listeners
 
 
 class BufferHandler(logging.Handler):
     """Logging handler that writes to in-memory buffer."""
 
+    # Local ISO-8601 timestamp, formatted without building a datetime per record
+    timestamp_format = "%Y-%m-%dT%H:%M:%S"
+
     def __init__(self, buffer: InMemoryLogBuffer):
         super().__init__()
         self.buffer = buffer
@@ -53,8 +101,9 @@ class BufferHandler(logging.Handler):
     def emit(self, record: logging.LogRecord):
         """Emit a log record to the buffer."""
         try:
+            timestamp = time.strftime(self.timestamp_format, time.localtime(record.created))
             log_entry = {
-                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+                "timestamp": f"{timestamp}.{int(record.msecs):03d}",
                 "level": record.levelname,
                 "module": record.name,
                 "message": record.getMessage(),
@@ -68,18 +117,34 @@ class BufferHandler(logging.Handler):
             self.handleError(record)
 
 
+class LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue that passes records through unformatted."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # No pickling involved, so keep exc_info for the downstream handlers
+        return record
+
+
 # Global log buffer
 log_buffer = InMemoryLogBuffer()
 
+# Background thread draining the logging queue into the real handlers
+_queue_listener: Optional[QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     """
     Configure application logging.
 
+    Records are enqueued by a QueueHandler and written by a background
+    QueueListener thread, so callers never block on console or file I/O.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs to
     """
+    global _queue_listener
+
     # Create formatter
     formatter = logging.Formatter(
         fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -90,27 +155,45 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level))
 
-    # Remove existing handlers
+    # Remove existing handlers and stop any previous listener
     root_logger.handlers.clear()
+    if _queue_listener:
+        _queue_listener.stop()
+        _queue_listener = None
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Buffer handler for streaming
     buffer_handler = BufferHandler(log_buffer)
     buffer_handler.setFormatter(formatter)
-    root_logger.addHandler(buffer_handler)
+    handlers.append(buffer_handler)
 
     # Optional file handler
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Producers only enqueue; the listener thread does the actual writes
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Set levels for noisy libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
     logging.info(f"Logging configured at {log_level} level")
+
+
+def _stop_queue_listener():
+    """Flush queued records and stop the listener thread at interpreter exit."""
+    if _queue_listener:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
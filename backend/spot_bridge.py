@@ -1,29 +1,140 @@
 """Spot SDK bridge with safety features and diagnostics."""
+import asyncio
+import concurrent.futures
 import logging
+import math
+import re
 import socket
 import threading
 import time
+from collections import Counter
 from typing import Optional, Dict, Any
 
 import bosdyn.client
+import bosdyn.client.channel
 import bosdyn.client.util
 from bosdyn.client import Robot, RpcError
+from bosdyn.client.exceptions import PermissionDeniedError, UnauthenticatedError
 from bosdyn.client.estop import EstopClient, EstopEndpoint, EstopKeepAlive
 from bosdyn.client.lease import LeaseClient, LeaseKeepAlive
 from bosdyn.client.power import PowerClient, power_on_motors, safe_power_off_motors
 from bosdyn.client.robot_command import RobotCommandClient, RobotCommandBuilder, blocking_stand, blocking_sit
 from bosdyn.client.robot_state import RobotStateClient
+from bosdyn.geometry import EulerZXY
 
 logger = logging.getLogger(__name__)
 
+# Stop the robot if no velocity command arrives within this many seconds
+VELOCITY_WATCHDOG_TIMEOUT = 0.5
+
+# Seconds a velocity command stays valid on the robot
+VELOCITY_COMMAND_DURATION = 0.25
+
+# Repeated velocity commands within VELOCITY_DEADBAND of the last one sent, and
+# less than VELOCITY_RESEND_INTERVAL after it, are not resent. After a skip the
+# next send comes one client period later, so the interval plus the UI's command
+# period (~130ms including RTT) plus RPC latency must stay under
+# VELOCITY_COMMAND_DURATION or the robot's command lapses mid-teleop
+VELOCITY_DEADBAND = 0.02
+VELOCITY_RESEND_INTERVAL = 0.08
+
+# Seconds between background robot state refreshes
+STATE_POLL_INTERVAL = 0.2
+
+# Seconds to reuse a resolved robot address in diagnostics
+ADDRINFO_TTL = 30.0
+
+
+def _clip(value: float, limit: float) -> float:
+    """Clamp value to [-limit, limit]; NaN and infinities become 0.0 (no motion)."""
+    if not math.isfinite(value):
+        return 0.0
+    return -limit if value < -limit else (limit if value > limit else value)
+
+
+# gRPC options for the shared API channel: keepalive pings on active connections
+# so dead links are detected quickly. Pings without calls stay disabled because
+# servers with default enforcement answer idle pings this frequent with GOAWAY.
+_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.keepalive_permit_without_calls", 0),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+)
+
+# Suggested fix by keyword in the lowercased error message; the keyword found
+# earliest in the message wins
+_ADVICE = {
+    "authentication": "Check SPOT_USER and SPOT_PASS credentials",
+    "credentials": "Check SPOT_USER and SPOT_PASS credentials",
+    "connection refused": "Check SPOT_HOST IP address and network connectivity",
+    "unreachable": "Check SPOT_HOST IP address and network connectivity",
+    "lease": "Another client may have the lease. Check Spot admin or release other clients.",
+    "time sync": "Check system time and NTP configuration",
+    "power": "Ensure robot is powered on before commanding movement",
+    "estop": "Check E-Stop status - physical or software E-Stop may be active",
+}
+_SUGGEST_RE = re.compile("|".join(map(re.escape, _ADVICE)))
+_DEFAULT_SUGGESTION = "Check connection and robot status. See logs for details."
+
+# Shared fast-fail results; returned by reference, so callers must not mutate them
+_NOT_CONNECTED_RESULT = {"ok": False, "error": {"message": "Not connected"}}
+_ESTOP_NOT_CONFIGURED = {"ok": False, "error": {"message": "E-Stop not configured"}}
+
+# Authority of the directory and core API services; the first directory lookup
+# opens this channel, so it has to be created with _CHANNEL_OPTIONS beforehand
+_API_AUTHORITY = "api.spot.robot"
+
+# One SDK per process; Robot objects configured from it keep their gRPC channels
+_SDK = bosdyn.client.create_standard_sdk("SpotWebController")
+
+
+def _wrap_future(future) -> asyncio.Future:
+    """Wrap an SDK FutureWrapper in an asyncio future on the running loop."""
+    loop = asyncio.get_running_loop()
+    aio_future = loop.create_future()
+
+    def _settle(result, error):
+        if aio_future.cancelled():
+            return
+        if error is not None:
+            aio_future.set_exception(error)
+        else:
+            aio_future.set_result(result)
+
+    def _on_done(fut):
+        # Runs on a gRPC thread; result() raises the SDK's translated errors
+        try:
+            result, error = fut.result(), None
+        except Exception as e:
+            result, error = None, e
+        loop.call_soon_threadsafe(_settle, result, error)
+
+    future.add_done_callback(_on_done)
+    return aio_future
+
 
 class SpotBridge:
     """Bridge to Boston Dynamics Spot robot with safety features."""
 
+    # Robot objects shared by (hostname, username) so test_connection, diagnose and
+    # connect (and reconnects) reuse the same authenticated channels
+    _robot_cache: Dict[tuple, Robot] = {}
+    _robot_cache_lock = threading.Lock()
+
+    # Dedicated (command, state) channels per Robot cache key, kept alongside the cached Robot
+    _channel_pool: Dict[tuple, tuple] = {}
+
+    # Shared worker threads for running diagnostic network probes in parallel
+    _probe_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="spot-probe")
+
     def __init__(self, hostname: str, username: str, password: str):
         self.hostname = hostname
         self.username = username
         self.password = password
+        # Key for the shared Robot and channels; tokens belong to one user
+        self._cache_key = (hostname, username)
 
         # Robot and clients
         self.robot: Optional[Robot] = None
@@ -39,9 +150,31 @@ class SpotBridge:
         self.estop_keepalive: Optional[EstopKeepAlive] = None
 
         # Safety tracking
-        self.last_velocity_time = 0.0
+        self.last_velocity_time = 0.0  # time.monotonic() of last command, 0 if idle
         self.watchdog_thread: Optional[threading.Thread] = None
         self.watchdog_active = False
+        self._watchdog_wake = threading.Event()
+
+        # Prebuilt velocity commands (the SDK copies them into each request)
+        self._zero_cmd = RobotCommandBuilder.synchro_velocity_command(v_x=0, v_y=0, v_rot=0, params=None)
+        self._vel_cmd = RobotCommandBuilder.synchro_velocity_command(v_x=0, v_y=0, v_rot=0, params=None)
+        self._velocity_lock = threading.Lock()
+        # (vx, vy, yaw, body_height, locomotion_hint, monotonic send time) of the last sent command
+        self._last_cmd: Optional[tuple] = None
+
+        # Latest status result from the state poller thread, served by get_status()
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._state_lock = threading.Lock()
+        self._state_stop = threading.Event()
+        self._state_thread: Optional[threading.Thread] = None
+
+        # Resolved API address shared by the network probes: (monotonic_time, addrinfo)
+        self._addrinfo_cache: Optional[tuple] = None
+        self._addrinfo_lock = threading.Lock()
+
+        # RobotId proto, fetched once per connection, and the status fields derived from it
+        self._robot_id = None
+        self._status_template: Dict[str, Any] = {}
 
         # Connection state
         self.connected = False
@@ -54,25 +187,49 @@ class SpotBridge:
             Result dictionary with ok status and data/error
         """
         try:
-            logger.info(f"Connecting to Spot at {self.hostname}...")
+            if self.connected:
+                # Stop the current watchdog, state poller and keepalives before
+                # starting new ones, so a repeated connect cannot orphan them
+                logger.info("Already connected, reconnecting...")
+                self._cleanup()
 
-            # Create SDK robot object
-            sdk = bosdyn.client.create_standard_sdk("SpotWebController")
-            self.robot = sdk.create_robot(self.hostname)
+            logger.info(f"Connecting to Spot at {self.hostname}...")
 
-            logger.info("Authenticating...")
-            self.robot.authenticate(self.username, self.password)
+            self.robot = self._get_or_create_robot()
+
+            if self.robot.user_token:
+                try:
+                    # Cheap authenticated RPC: fails if the cached token expired or was
+                    # revoked, which the SDK's token refresh cannot recover from
+                    self.robot.sync_with_directory()
+                    logger.info("Reusing authenticated session")
+                except (UnauthenticatedError, PermissionDeniedError) as e:
+                    logger.warning(f"Cached session rejected ({e}), authenticating again")
+                    self.robot.user_token = None
+            if not self.robot.user_token:
+                logger.info("Authenticating...")
+                self.robot.authenticate(self.username, self.password)
 
             logger.info("Syncing time...")
             self.robot.time_sync.wait_for_sync()
 
             logger.info("Initializing clients...")
-            self.command_client = self.robot.ensure_client(RobotCommandClient.default_service_name)
-            self.state_client = self.robot.ensure_client(RobotStateClient.default_service_name)
+            command_channel, state_channel = self._get_or_open_channels(self.robot)
+            self.command_client = self.robot.ensure_client(RobotCommandClient.default_service_name,
+                                                           channel=command_channel)
+            self.state_client = self.robot.ensure_client(RobotStateClient.default_service_name,
+                                                         channel=state_channel)
             self.lease_client = self.robot.ensure_client(LeaseClient.default_service_name)
             self.power_client = self.robot.ensure_client(PowerClient.default_service_name)
             self.estop_client = self.robot.ensure_client(EstopClient.default_service_name)
 
+            self._robot_id = self.robot.get_cached_robot_id()
+            self._status_template = {
+                "connected": True,
+                "robot_id": self._robot_id.serial_number,
+                "robot_nickname": self._robot_id.nickname,
+            }
+
             logger.info("Acquiring lease...")
             self.lease_client.take()
             self.lease_keepalive = LeaseKeepAlive(self.lease_client, must_acquire=True, return_at_exit=True)
@@ -84,9 +241,16 @@ class SpotBridge:
 
             logger.info("Starting watchdog...")
             self.watchdog_active = True
+            self._watchdog_wake.clear()
             self.watchdog_thread = threading.Thread(target=self._watchdog_loop, daemon=True)
             self.watchdog_thread.start()
 
+            logger.info("Starting state poller...")
+            # A fresh Event per poller, so one that outlived _cleanup's join stays stopped
+            self._state_stop = threading.Event()
+            self._state_thread = threading.Thread(target=self._state_loop, args=(self._state_stop,), daemon=True)
+            self._state_thread.start()
+
             self.connected = True
             logger.info("Successfully connected to Spot")
 
@@ -94,33 +258,83 @@ class SpotBridge:
                 "ok": True,
                 "data": {
                     "message": "Connected to Spot",
-                    "robot_id": self.robot.get_id().serial_number,
+                    "robot_id": self._robot_id.serial_number,
                 }
             }
 
         except RpcError as e:
-            error_msg = str(e)
-            logger.error(f"RPC error during connection: {error_msg}")
+            logger.error(f"RPC error during connection: {e}")
             self._cleanup()
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": error_msg,
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
         except Exception as e:
             logger.error(f"Unexpected error during connection: {e}", exc_info=True)
             self._cleanup()
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check network connection and Spot configuration"
-                }
-            }
+            return self._rpc_err(e, "Check network connection and Spot configuration")
+
+    def _get_or_create_robot(self) -> Robot:
+        """Return the shared Robot for this hostname and user, creating it on first use."""
+        with SpotBridge._robot_cache_lock:
+            robot = SpotBridge._robot_cache.get(self._cache_key)
+            if robot is None:
+                # Built like Sdk.create_robot(), which would hand every user the
+                # same Robot (and user token) for an address
+                robot = Robot(name=self.hostname)
+                robot.address = self.hostname
+                robot.update_from(_SDK)
+                self._ensure_api_channel(robot)
+                SpotBridge._robot_cache[self._cache_key] = robot
+            return robot
+
+    @staticmethod
+    def _ensure_api_channel(robot: Robot):
+        """
+        Open the shared API channel with _CHANNEL_OPTIONS.
+
+        The Robot caches one channel per authority and only applies options when
+        creating it, and ensure_channel() opens this authority's channel for its
+        directory lookup before the options would apply. So it is created directly,
+        right after the Robot and before any RPC. Channels connect lazily and read
+        the user token per call, so no authentication is needed yet.
+        """
+        robot.ensure_secure_channel(_API_AUTHORITY, options=list(_CHANNEL_OPTIONS))
+
+    def _get_or_open_channels(self, robot: Robot) -> tuple:
+        """
+        Return the (command, state) channels for this hostname and user, opening them on first use.
+
+        Each is its own HTTP/2 connection, so a slow robot_command does not hold up
+        get_robot_state behind it; lease, E-Stop and power stay on the shared API
+        channel. The Robot caches the clients built on these channels, so they live
+        as long as the Robot and are not closed in _cleanup.
+        """
+        with SpotBridge._robot_cache_lock:
+            channels = SpotBridge._channel_pool.get(self._cache_key)
+            if channels is None:
+                channels = (
+                    self._open_channel(robot, RobotCommandClient.default_service_name),
+                    self._open_channel(robot, RobotStateClient.default_service_name),
+                )
+                SpotBridge._channel_pool[self._cache_key] = channels
+            return channels
+
+    @staticmethod
+    def _open_channel(robot: Robot, service_name: str):
+        """Open a new secure channel to service_name, bypassing the Robot's per-authority cache."""
+        authority = robot.authorities_by_name[service_name]
+        options = list(_CHANNEL_OPTIONS) + [
+            ("grpc.max_receive_message_length", robot.max_receive_message_length),
+            ("grpc.max_send_message_length", robot.max_send_message_length),
+            # Without a local pool gRPC would share one subchannel (TCP connection)
+            # between channels with identical targets and arguments
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+        creds = bosdyn.client.channel.create_secure_channel_creds(robot.cert, lambda: robot.user_token)
+        # The public Robot.ensure_secure_channel() returns the one cached channel per
+        # authority, so a second connection needs create_secure_channel() directly. Robot
+        # exposes no getter for its port (only update_secure_channel_port()), so read the
+        # attribute ensure_secure_channel() itself uses to stay in step with that setter.
+        return bosdyn.client.channel.create_secure_channel(robot.address, robot._secure_channel_port, creds,
+                                                          authority, options=options)
 
     def disconnect(self) -> Dict[str, Any]:
         """
@@ -136,14 +350,7 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Disconnected"}}
         except Exception as e:
             logger.error(f"Error during disconnect: {e}", exc_info=True)
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Force restart may be required"
-                }
-            }
+            return self._rpc_err(e, "Force restart may be required")
 
     def _cleanup(self):
         """Clean up connections and resources."""
@@ -151,9 +358,21 @@ class SpotBridge:
 
         # Stop watchdog
         self.watchdog_active = False
+        self._watchdog_wake.set()
         if self.watchdog_thread and self.watchdog_thread.is_alive():
             self.watchdog_thread.join(timeout=2.0)
 
+        self._last_cmd = None
+
+        # Stop state poller
+        self._state_stop.set()
+        if self._state_thread and self._state_thread.is_alive():
+            self._state_thread.join(timeout=2.0)
+            if self._state_thread.is_alive():
+                logger.warning("State poller still blocked in an RPC; it will exit when the call returns")
+        with self._state_lock:
+            self._state_cache = None
+
         # Stop E-Stop keepalive
         if self.estop_keepalive:
             try:
@@ -179,13 +398,15 @@ class SpotBridge:
             except Exception as e:
                 logger.warning(f"Error returning lease: {e}")
 
-        # Clear references
+        # Clear references (the cached Robot and its channels stay alive for reconnects)
         self.estop_endpoint = None
         self.estop_client = None
         self.power_client = None
         self.lease_client = None
         self.state_client = None
         self.command_client = None
+        self._robot_id = None
+        self._status_template = {}
         self.robot = None
 
     def _watchdog_loop(self):
@@ -193,26 +414,50 @@ class SpotBridge:
         logger.info("Watchdog thread started")
         while self.watchdog_active:
             try:
+                # Sleep until the current command's deadline, or indefinitely when idle;
+                # send_velocity() and _cleanup() wake the thread early
                 if self.last_velocity_time > 0:
-                    time_since_last = time.time() - self.last_velocity_time
-                    if time_since_last > 0.5:
-                        logger.warning("Velocity timeout detected, sending stop command")
-                        self._send_zero_velocity()
-                        self.last_velocity_time = 0.0
-                time.sleep(0.1)
+                    deadline = self.last_velocity_time + VELOCITY_WATCHDOG_TIMEOUT
+                    timeout = max(0.0, deadline - time.monotonic())
+                else:
+                    timeout = None
+                self._watchdog_wake.wait(timeout)
+                self._watchdog_wake.clear()
+
+                last = self.last_velocity_time
+                if self.watchdog_active and last > 0 and time.monotonic() - last >= VELOCITY_WATCHDOG_TIMEOUT:
+                    logger.warning("Velocity timeout detected, sending stop command")
+                    self._send_zero_velocity()
+                    self.last_velocity_time = 0.0
             except Exception as e:
                 logger.error(f"Error in watchdog: {e}", exc_info=True)
         logger.info("Watchdog thread stopped")
 
+    def _state_loop(self, stop: threading.Event):
+        """State poller thread that keeps _state_cache fresh for get_status() until stop is set."""
+        logger.info("State poller started")
+        was_ok = True
+        while not stop.is_set():
+            result = self._fetch_status()
+            with self._state_lock:
+                # A poller stopped mid-RPC must not overwrite a newer connection's snapshot
+                if stop.is_set():
+                    break
+                self._state_cache = result
+            # Log failures once per outage rather than on every poll
+            if was_ok and not result["ok"]:
+                logger.error(f"Error polling robot state: {result['error']['message']}")
+            was_ok = result["ok"]
+            stop.wait(STATE_POLL_INTERVAL)
+        logger.info("State poller stopped")
+
     def _send_zero_velocity(self):
         """Send zero velocity command (internal use)."""
+        self._last_cmd = None
         try:
             if self.robot and self.command_client:
-                cmd = RobotCommandBuilder.synchro_velocity_command(
-                    v_x=0, v_y=0, v_rot=0,
-                    params=None
-                )
-                self.command_client.robot_command(cmd, end_time_secs=time.time() + 0.25)
+                self.command_client.robot_command(self._zero_cmd,
+                                                  end_time_secs=time.time() + VELOCITY_COMMAND_DURATION)
         except Exception as e:
             logger.error(f"Error sending zero velocity: {e}")
 
@@ -229,6 +474,24 @@ class SpotBridge:
                 "error": {"message": "Not connected to robot"}
             }
 
+        with self._state_lock:
+            cached = self._state_cache
+        if cached is None:
+            # Poller has not completed its first refresh yet
+            cached = self._fetch_status()
+            if not cached["ok"]:
+                logger.error(f"Error getting status: {cached['error']['message']}")
+        if not cached["ok"]:
+            return cached
+
+        data = dict(cached["data"])
+        data["lease_status"] = "active" if self.lease_keepalive else "none"
+        data["estop_status"] = "ok" if self.estop_keepalive else "not_configured"
+        data["timestamp"] = time.time()
+        return {"ok": True, "data": data}
+
+    def _fetch_status(self) -> Dict[str, Any]:
+        """Fetch robot state over RPC and build a status result."""
         try:
             # Get robot state
             state = self.state_client.get_robot_state()
@@ -237,49 +500,23 @@ class SpotBridge:
             battery_state = state.battery_states[0] if state.battery_states else None
             power_state = state.power_state
 
-            status = {
-                "ok": True,
-                "data": {
-                    "connected": True,
-                    "robot_id": self.robot.get_id().serial_number,
-                    "robot_nickname": self.robot.get_id().nickname,
-                    "battery_percentage": battery_state.charge_percentage.value if battery_state else 0,
-                    "battery_runtime": battery_state.estimated_runtime.seconds if battery_state else 0,
-                    "is_powered_on": power_state.motor_power_state == power_state.STATE_ON,
-                    "power_state": power_state.motor_power_state,
-                    "lease_status": "active" if self.lease_keepalive else "none",
-                    "estop_status": "ok" if self.estop_keepalive else "not_configured",
-                    "timestamp": time.time(),
-                }
-            }
+            data = dict(self._status_template)
+            data["battery_percentage"] = battery_state.charge_percentage.value if battery_state else 0
+            data["battery_runtime"] = battery_state.estimated_runtime.seconds if battery_state else 0
+            data["is_powered_on"] = power_state.motor_power_state == power_state.STATE_ON
+            data["power_state"] = power_state.motor_power_state
 
-            return status
+            return {"ok": True, "data": data}
 
         except RpcError as e:
-            logger.error(f"RPC error getting status: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
         except Exception as e:
-            logger.error(f"Error getting status: {e}", exc_info=True)
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check connection to robot"
-                }
-            }
+            return self._rpc_err(e, "Check connection to robot")
 
     def power_on(self) -> Dict[str, Any]:
         """Power on robot motors."""
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
             logger.info("Powering on robot...")
@@ -288,19 +525,12 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Powered on"}}
         except RpcError as e:
             logger.error(f"Error powering on: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
 
     def power_off(self) -> Dict[str, Any]:
         """Safely power off robot motors."""
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
             logger.info("Powering off robot...")
@@ -309,19 +539,12 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Powered off"}}
         except RpcError as e:
             logger.error(f"Error powering off: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
 
     def stand(self) -> Dict[str, Any]:
         """Command robot to stand."""
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
             logger.info("Commanding robot to stand...")
@@ -330,19 +553,12 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Standing"}}
         except RpcError as e:
             logger.error(f"Error standing: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
 
     def sit(self) -> Dict[str, Any]:
         """Command robot to sit."""
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
             logger.info("Commanding robot to sit...")
@@ -351,14 +567,7 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Sitting"}}
         except RpcError as e:
             logger.error(f"Error sitting: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
 
     def send_velocity(self, vx: float, vy: float, yaw: float,
                       body_height: float = 0.0, body_roll: float = 0.0,
@@ -381,74 +590,125 @@ class SpotBridge:
             Result dictionary
         """
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
-            # Clamp to safe ranges
-            vx = max(-0.5, min(0.5, vx))
-            vy = max(-0.5, min(0.5, vy))
-            yaw = max(-0.5, min(0.5, yaw))
-            body_height = max(-0.3, min(0.3, body_height))
-
-            # Build command - use body_height and locomotion_hint if provided
-            if locomotion_hint is not None or body_height != 0.0:
-                logger.debug(f"Velocity with params: height={body_height:.3f}, hint={locomotion_hint}")
-                cmd = RobotCommandBuilder.synchro_velocity_command(
-                    v_x=vx, v_y=vy, v_rot=yaw,
-                    body_height=body_height,
-                    locomotion_hint=locomotion_hint if locomotion_hint is not None else 1
-                )
-            else:
-                logger.debug(f"Velocity without params")
-                cmd = RobotCommandBuilder.synchro_velocity_command(
-                    v_x=vx, v_y=vy, v_rot=yaw,
-                    params=None
-                )
-
-            # Send with end time
-            end_time = time.time() + 0.25
-            self.command_client.robot_command(cmd, end_time_secs=end_time)
+            future, sent = self._start_velocity(vx, vy, yaw, body_height, locomotion_hint)
+            if future is not None:
+                future.result()
+            return self._velocity_sent(future, sent)
+        except RpcError as e:
+            logger.error(f"Error sending velocity: {e}")
+            return self._rpc_err(e)
+        except Exception as e:
+            logger.error(f"Unexpected error in send_velocity: {e}", exc_info=True)
+            return self._rpc_err(e, "Check logs for details")
 
-            # Update watchdog
-            self.last_velocity_time = time.time()
+    async def send_velocity_async(self, vx: float, vy: float, yaw: float,
+                                  body_height: float = 0.0, body_roll: float = 0.0,
+                                  body_pitch: float = 0.0, body_yaw: float = 0.0,
+                                  locomotion_hint: int = None) -> Dict[str, Any]:
+        """
+        Like send_velocity(), but awaits the RPC on the running event loop.
 
-            logger.debug(f"Sent velocity: vx={vx:.2f}, vy={vy:.2f}, yaw={yaw:.2f}, height={body_height:.2f}")
+        The SDK issues the RPC without blocking, so no worker thread waits on it.
 
-            return {
-                "ok": True,
-                "data": {
-                    "vx": vx,
-                    "vy": vy,
-                    "yaw": yaw,
-                    "body_height": body_height
-                }
-            }
+        Returns:
+            Result dictionary
+        """
+        if not self.connected:
+            return _NOT_CONNECTED_RESULT
 
+        try:
+            future, sent = self._start_velocity(vx, vy, yaw, body_height, locomotion_hint)
+            if future is not None:
+                await _wrap_future(future)
+            return self._velocity_sent(future, sent)
         except RpcError as e:
             logger.error(f"Error sending velocity: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
         except Exception as e:
             logger.error(f"Unexpected error in send_velocity: {e}", exc_info=True)
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check logs for details"
-                }
+            return self._rpc_err(e, "Check logs for details")
+
+    def _start_velocity(self, vx: float, vy: float, yaw: float,
+                        body_height: float, locomotion_hint: Optional[int]) -> tuple:
+        """
+        Clamp a velocity command and start its RPC.
+
+        Returns:
+            (future, sent): the SDK future for the RPC, or None when the command was
+            coalesced into the previous one, and the clamped
+            (vx, vy, yaw, body_height, locomotion_hint, monotonic issue time) to pass
+            to _velocity_sent() once the RPC succeeds
+        """
+        # Clamp to safe ranges
+        vx = _clip(vx, 0.5)
+        vy = _clip(vy, 0.5)
+        yaw = _clip(yaw, 0.5)
+        body_height = _clip(body_height, 0.3)
+
+        # Command end time must be wall clock for the SDK; the dead-band uses monotonic
+        now = time.monotonic()
+        end_time = time.time() + VELOCITY_COMMAND_DURATION
+
+        # Skip the RPC when the previous command is near-identical and still fresh;
+        # all-zero commands are always sent so a stop is never coalesced away
+        last = self._last_cmd
+        if (last is not None and (vx or vy or yaw)
+                and now - last[5] < VELOCITY_RESEND_INTERVAL
+                and last[3] == body_height and last[4] == locomotion_hint
+                and max(abs(vx - last[0]), abs(vy - last[1]), abs(yaw - last[2])) < VELOCITY_DEADBAND):
+            return None, last[:5] + (now,)
+
+        # Build command - use body_height and locomotion_hint if provided
+        if locomotion_hint is not None or body_height != 0.0:
+            logger.debug(f"Velocity with params: height={body_height:.3f}, hint={locomotion_hint}")
+            cmd = RobotCommandBuilder.synchro_velocity_command(
+                v_x=vx, v_y=vy, v_rot=yaw,
+                body_height=body_height,
+                locomotion_hint=locomotion_hint if locomotion_hint is not None else 1
+            )
+            future = self.command_client.robot_command_async(cmd, end_time_secs=end_time)
+        else:
+            logger.debug(f"Velocity without params")
+            # Patch the prebuilt command in place; the SDK copies it into the request
+            # before returning, and the lock keeps concurrent callers from sending
+            # each other's half-written velocities
+            with self._velocity_lock:
+                velocity = self._vel_cmd.synchronized_command.mobility_command.se2_velocity_request.velocity
+                velocity.linear.x = vx
+                velocity.linear.y = vy
+                velocity.angular = yaw
+                future = self.command_client.robot_command_async(self._vel_cmd, end_time_secs=end_time)
+
+        return future, (vx, vy, yaw, body_height, locomotion_hint, now)
+
+    def _velocity_sent(self, future, sent: tuple) -> Dict[str, Any]:
+        """Record a completed (or coalesced) velocity command and build its result."""
+        vx, vy, yaw, body_height = sent[:4]
+        if future is not None:
+            self._last_cmd = sent
+            logger.debug(f"Sent velocity: vx={vx:.2f}, vy={vy:.2f}, yaw={yaw:.2f}, height={body_height:.2f}")
+
+        # Update watchdog with the time the command was issued, not when the RPC returned
+        self.last_velocity_time = sent[5]
+        self._watchdog_wake.set()
+
+        return {
+            "ok": True,
+            "data": {
+                "vx": vx,
+                "vy": vy,
+                "yaw": yaw,
+                "body_height": body_height
             }
+        }
 
     def stop(self) -> Dict[str, Any]:
         """Emergency stop - halt all motion."""
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
             logger.warning("EMERGENCY STOP commanded")
@@ -457,14 +717,7 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "Stopped"}}
         except Exception as e:
             logger.error(f"Error during emergency stop: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Physical E-Stop may be required"
-                }
-            }
+            return self._rpc_err(e, "Physical E-Stop may be required")
 
     def set_body_pose(self, height: float, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0) -> Dict[str, Any]:
         """
@@ -480,18 +733,14 @@ class SpotBridge:
             Result dictionary
         """
         if not self.connected:
-            return {"ok": False, "error": {"message": "Not connected"}}
+            return _NOT_CONNECTED_RESULT
 
         try:
-            # Import geometry for body positioning
-            from bosdyn.geometry import EulerZXY
-            import math
-
             # Clamp values to safe ranges
-            height = max(-0.3, min(0.3, height))
-            roll = max(-0.3, min(0.3, roll))
-            pitch = max(-0.3, min(0.3, pitch))
-            yaw = max(-0.3, min(0.3, yaw))
+            height = _clip(height, 0.3)
+            roll = _clip(roll, 0.3)
+            pitch = _clip(pitch, 0.3)
+            yaw = _clip(yaw, 0.3)
 
             # Create body control parameters
             footprint_R_body = EulerZXY(yaw=yaw, roll=roll, pitch=pitch)
@@ -519,29 +768,15 @@ class SpotBridge:
 
         except RpcError as e:
             logger.error(f"Error setting body pose: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": self._suggest_fix_for_error(e)
-                }
-            }
+            return self._rpc_err(e)
         except Exception as e:
             logger.error(f"Unexpected error setting body pose: {e}", exc_info=True)
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check that robot is standing and powered on"
-                }
-            }
+            return self._rpc_err(e, "Check that robot is standing and powered on")
 
     def estop_stop(self) -> Dict[str, Any]:
         """Trigger software E-Stop."""
         if not self.connected or not self.estop_endpoint:
-            return {"ok": False, "error": {"message": "E-Stop not configured"}}
+            return _ESTOP_NOT_CONFIGURED
 
         try:
             logger.warning("E-Stop triggered")
@@ -549,19 +784,12 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "E-Stop triggered"}}
         except Exception as e:
             logger.error(f"Error triggering E-Stop: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check E-Stop configuration"
-                }
-            }
+            return self._rpc_err(e, "Check E-Stop configuration")
 
     def estop_release(self) -> Dict[str, Any]:
         """Release software E-Stop."""
         if not self.connected or not self.estop_endpoint:
-            return {"ok": False, "error": {"message": "E-Stop not configured"}}
+            return _ESTOP_NOT_CONFIGURED
 
         try:
             logger.info("Releasing E-Stop")
@@ -569,14 +797,7 @@ class SpotBridge:
             return {"ok": True, "data": {"message": "E-Stop released"}}
         except Exception as e:
             logger.error(f"Error releasing E-Stop: {e}")
-            return {
-                "ok": False,
-                "error": {
-                    "error_type": e.__class__.__name__,
-                    "message": str(e),
-                    "suggested_fix": "Check E-Stop configuration"
-                }
-            }
+            return self._rpc_err(e, "Check E-Stop configuration")
 
     def diagnose(self) -> Dict[str, Any]:
         """
@@ -587,45 +808,22 @@ class SpotBridge:
         """
         checks = []
 
-        # DNS resolution
-        try:
-            socket.gethostbyname(self.hostname)
-            checks.append({
-                "name": "DNS Resolution",
-                "status": "pass",
-                "message": f"Successfully resolved {self.hostname}"
-            })
-        except socket.gaierror as e:
-            checks.append({
-                "name": "DNS Resolution",
-                "status": "fail",
-                "message": f"Failed to resolve {self.hostname}: {e}"
-            })
-
-        # Network connectivity
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((self.hostname, 443))
-            sock.close()
-            if result == 0:
-                checks.append({
-                    "name": "Network Connectivity",
-                    "status": "pass",
-                    "message": f"Can reach {self.hostname}:443"
-                })
+        # DNS resolution and network connectivity are independent; run them in
+        # parallel so the slow paths overlap instead of adding up
+        probes = [
+            ("DNS Resolution", self._probe_executor.submit(self._dns_check)),
+            ("Network Connectivity", self._probe_executor.submit(self._tcp_check)),
+        ]
+        concurrent.futures.wait([future for _, future in probes], timeout=2.5)
+        for name, future in probes:
+            if future.done():
+                checks.append(future.result())
             else:
                 checks.append({
-                    "name": "Network Connectivity",
+                    "name": name,
                     "status": "fail",
-                    "message": f"Cannot reach {self.hostname}:443"
+                    "message": f"{name} check timed out"
                 })
-        except Exception as e:
-            checks.append({
-                "name": "Network Connectivity",
-                "status": "fail",
-                "message": f"Network check failed: {e}"
-            })
 
         # Connection status
         if self.connected:
@@ -670,9 +868,8 @@ class SpotBridge:
             })
 
         # Summary
-        pass_count = sum(1 for c in checks if c["status"] == "pass")
-        fail_count = sum(1 for c in checks if c["status"] == "fail")
-        warn_count = sum(1 for c in checks if c["status"] == "warn")
+        counts = Counter(c["status"] for c in checks)
+        pass_count, fail_count, warn_count = counts["pass"], counts["fail"], counts["warn"]
 
         return {
             "ok": True,
@@ -683,6 +880,61 @@ class SpotBridge:
             }
         }
 
+    def _resolve(self) -> list:
+        """Resolve the robot's API address, reusing a recent successful lookup."""
+        with self._addrinfo_lock:
+            cached = self._addrinfo_cache
+            if cached and time.monotonic() - cached[0] < ADDRINFO_TTL:
+                return cached[1]
+            infos = socket.getaddrinfo(self.hostname, 443, socket.AF_INET, socket.SOCK_STREAM)
+            self._addrinfo_cache = (time.monotonic(), infos)
+            return infos
+
+    def _dns_check(self) -> Dict[str, Any]:
+        """Diagnostic check: resolve the robot hostname."""
+        try:
+            self._resolve()
+            return {
+                "name": "DNS Resolution",
+                "status": "pass",
+                "message": f"Successfully resolved {self.hostname}"
+            }
+        except socket.gaierror as e:
+            return {
+                "name": "DNS Resolution",
+                "status": "fail",
+                "message": f"Failed to resolve {self.hostname}: {e}"
+            }
+
+    def _tcp_check(self) -> Dict[str, Any]:
+        """Diagnostic check: open a TCP connection to the robot's API port."""
+        try:
+            family, socktype, proto, _, address = self._resolve()[0]
+            with socket.socket(family, socktype, proto) as sock:
+                # Options set before connect, so any handshake added to the probe
+                # is not delayed by Nagle's algorithm
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                sock.settimeout(2)
+                sock.connect(address)
+            return {
+                "name": "Network Connectivity",
+                "status": "pass",
+                "message": f"Can reach {self.hostname}:443"
+            }
+        except socket.gaierror as e:
+            return {
+                "name": "Network Connectivity",
+                "status": "fail",
+                "message": f"Network check failed: {e}"
+            }
+        except OSError as e:
+            return {
+                "name": "Network Connectivity",
+                "status": "fail",
+                "message": f"Cannot reach {self.hostname}:443 ({e})"
+            }
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Comprehensive connection test.
@@ -694,38 +946,15 @@ class SpotBridge:
 
         # Test 1: Ping
         logger.info("Testing ping...")
-        try:
-            result = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result.settimeout(2)
-            connect_result = result.connect_ex((self.hostname, 443))
-            result.close()
-
-            if connect_result == 0:
-                tests.append({
-                    "name": "Network Connectivity",
-                    "status": "pass",
-                    "message": f"Successfully reached {self.hostname}:443"
-                })
-            else:
-                tests.append({
-                    "name": "Network Connectivity",
-                    "status": "fail",
-                    "message": f"Cannot reach {self.hostname}:443 (error {connect_result})"
-                })
-                return {"ok": True, "data": {"tests": tests, "summary": "Network unreachable"}}
-        except Exception as e:
-            tests.append({
-                "name": "Network Connectivity",
-                "status": "fail",
-                "message": f"Network error: {str(e)}"
-            })
-            return {"ok": True, "data": {"tests": tests, "summary": "Network error"}}
+        check = self._tcp_check()
+        tests.append(check)
+        if check["status"] == "fail":
+            return {"ok": True, "data": {"tests": tests, "summary": "Network unreachable"}}
 
         # Test 2: Robot ID (no auth needed)
         logger.info("Testing robot ID...")
         try:
-            sdk = bosdyn.client.create_standard_sdk("SpotConnectionTest")
-            test_robot = sdk.create_robot(self.hostname)
+            test_robot = self._get_or_create_robot()
             robot_id = test_robot.get_id()
 
             tests.append({
@@ -775,8 +1004,8 @@ class SpotBridge:
             })
 
         # Summary
-        pass_count = sum(1 for t in tests if t["status"] == "pass")
-        fail_count = sum(1 for t in tests if t["status"] == "fail")
+        counts = Counter(t["status"] for t in tests)
+        pass_count, fail_count = counts["pass"], counts["fail"]
 
         if fail_count == 0:
             summary = f"✓ All tests passed ({pass_count}/{len(tests)})"
@@ -792,21 +1021,39 @@ class SpotBridge:
             }
         }
 
+    def _rpc_err(self, e: Exception, suggested_fix: Optional[str] = None) -> Dict[str, Any]:
+        """Build an error result for e, suggesting a fix from the message unless one is given."""
+        return {
+            "ok": False,
+            "error": {
+                "error_type": e.__class__.__name__,
+                "message": str(e),
+                "suggested_fix": suggested_fix if suggested_fix is not None else self._suggest_fix_for_error(e)
+            }
+        }
+
     def _suggest_fix_for_error(self, error: Exception) -> str:
         """Suggest fixes for common errors."""
-        error_str = str(error).lower()
-
-        if "authentication" in error_str or "credentials" in error_str:
-            return "Check SPOT_USER and SPOT_PASS credentials"
-        elif "connection refused" in error_str or "unreachable" in error_str:
-            return "Check SPOT_HOST IP address and network connectivity"
-        elif "lease" in error_str:
-            return "Another client may have the lease. Check Spot admin or release other clients."
-        elif "time sync" in error_str:
-            return "Check system time and NTP configuration"
-        elif "power" in error_str:
-            return "Ensure robot is powered on before commanding movement"
-        elif "estop" in error_str:
-            return "Check E-Stop status - physical or software E-Stop may be active"
-        else:
-            return "Check connection and robot status. See logs for details."
+        match = _SUGGEST_RE.search(str(error).lower())
+        return _ADVICE[match.group(0)] if match else _DEFAULT_SUGGESTION
+
+
+# Bridges shared by (hostname, username) so every caller drives the same lease and channels
+_BRIDGES: Dict[tuple, SpotBridge] = {}
+_BRIDGES_LOCK = threading.Lock()
+
+
+def get_bridge(hostname: str, username: str, password: str) -> SpotBridge:
+    """
+    Return the shared SpotBridge for hostname and username, creating it on first use.
+
+    The bridge is not connected here; acquiring the lease and E-Stop stays an explicit
+    connect() call.
+    """
+    key = (hostname, username)
+    with _BRIDGES_LOCK:
+        bridge = _BRIDGES.get(key)
+        if bridge is None:
+            bridge = SpotBridge(hostname, username, password)
+            _BRIDGES[key] = bridge
+        return bridge
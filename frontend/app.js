@@ -22,6 +22,7 @@ const state = {
 // WebSocket connections
 let telemetryWs = null;
 let logsWs = null;
+const telemetryDecoder = new TextDecoder();
 
 // DOM elements
 const elements = {
@@ -333,13 +334,18 @@ function connectTelemetryWebSocket() {
     const wsUrl = `${protocol}//${window.location.host}/ws/telemetry`;
 
     telemetryWs = new WebSocket(wsUrl);
+    // Telemetry is sent as binary (UTF-8 encoded JSON) frames
+    telemetryWs.binaryType = 'arraybuffer';
 
     telemetryWs.onopen = () => {
         console.log('Telemetry WebSocket connected');
     };
 
     telemetryWs.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+        const text = typeof event.data === 'string'
+            ? event.data
+            : telemetryDecoder.decode(event.data);
+        const data = JSON.parse(text);
         updateStatusUI(data);
     };
 
@@ -364,8 +370,10 @@ function connectLogsWebSocket() {
     };
 
     logsWs.onmessage = (event) => {
-        const logEntry = JSON.parse(event.data);
-        appendLog(logEntry);
+        const payload = JSON.parse(event.data);
+        // Live logs arrive in batches; the initial replay sends single entries
+        const entries = Array.isArray(payload) ? payload : [payload];
+        entries.forEach(appendLog);
     };
 
     logsWs.onclose = () => {
@@ -1307,10 +1315,11 @@ async function handleCopyLogs() {
 async function handleDownloadLogs() {
     try {
         const response = await fetch('/api/logs/download');
-        const data = await response.json();
+        const contentType = response.headers.get('content-type') || '';
 
-        if (data.ok && data.data.logs) {
-            const blob = new Blob([data.data.logs], { type: 'text/plain' });
+        // The log file is streamed as text/plain; errors come back as JSON
+        if (response.ok && contentType.startsWith('text/plain')) {
+            const blob = await response.blob();
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;